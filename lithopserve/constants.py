@@ -24,7 +24,40 @@ LOGGER_FORMAT = "%(asctime)s [%(levelname)s] %(filename)s:%(lineno)s -- %(messag
 LOGGER_FORMAT_SHORT = "[%(levelname)s] %(filename)s:%(lineno)s -- %(message)s"
 LOGGER_LEVEL_CHOICES = ["debug", "info", "warning", "error", "critical"]
 
-CPU_COUNT = os.cpu_count()
+
+def _usable_cpu_count():
+    """
+    Number of CPUs this process can actually use. os.cpu_count() reports
+    the whole host, which oversubscribes workers inside containers or
+    under CPU affinity; prefer the affinity mask and cgroup CPU quotas.
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count()
+
+    try:
+        # cgroup v2
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            cores = min(cores, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        try:
+            # cgroup v1
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+                quota = int(f.read())
+            with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+                period = int(f.read())
+            if quota > 0:
+                cores = min(cores, max(1, quota // period))
+        except (OSError, ValueError):
+            pass
+
+    return cores
+
+
+CPU_COUNT = _usable_cpu_count()
 
 STORAGE_CLI_MSG = '{} client created'
 COMPUTE_CLI_MSG = '{} client created'
@@ -193,25 +193,15 @@ class Invoker:
         logger.debug('ExecutorID {} | JobID {} - Worker processes: {} - Chunksize: {}'
                      .format(job.executor_id, job.job_id, job.worker_processes, job.chunksize or "AUTO"))
 
-        self.prometheus.send_metric(
-            name='job_total_calls',
-            value=job.total_calls,
-            type='counter',
-            labels=(
-                ('job_id', job.job_key),
-                ('function_name', job.function_name)
-            )
+        job_labels = (
+            ('job_id', job.job_key),
+            ('function_name', job.function_name)
         )
 
-        self.prometheus.send_metric(
-            name='job_runtime_memory',
-            value=job.runtime_memory or 0,
-            type='counter',
-            labels=(
-                ('job_id', job.job_key),
-                ('function_name', job.function_name)
-            )
-        )
+        self.prometheus.send_batch((
+            ('job_total_calls', job.total_calls, 'counter', job_labels),
+            ('job_runtime_memory', job.runtime_memory or 0, 'counter', job_labels)
+        ))
 
         try:
             job.runtime_name = self.runtime_name
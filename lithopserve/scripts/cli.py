@@ -134,13 +134,19 @@ def clean(config, backend, storage, debug, region, all):
     storage = internal_storage.storage
     runtimes_path = RUNTIMES_PREFIX + '/' + backend
     jobs_path = JOBS_PREFIX
-    clean_bucket(storage, storage_config['bucket'], runtimes_path, sleep=1)
-    clean_bucket(storage, storage_config['bucket'], jobs_path, sleep=1)
-
-    # Clean localhost executor temp dirs
-    shutil.rmtree(LITHOPS_TEMP_DIR, ignore_errors=True)
-    # Clean local lithopserve runtime cache
-    shutil.rmtree(os.path.join(CACHE_DIR, RUNTIMES_PREFIX, backend), ignore_errors=True)
+    # The bucket scans and local dir removals are independent and
+    # I/O-bound, so run them in parallel
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tasks = [
+            executor.submit(clean_bucket, storage, storage_config['bucket'], runtimes_path, sleep=1),
+            executor.submit(clean_bucket, storage, storage_config['bucket'], jobs_path, sleep=1),
+            # Clean localhost executor temp dirs
+            executor.submit(shutil.rmtree, LITHOPS_TEMP_DIR, ignore_errors=True),
+            # Clean local lithopserve runtime cache
+            executor.submit(shutil.rmtree, os.path.join(CACHE_DIR, RUNTIMES_PREFIX, backend), ignore_errors=True)
+        ]
+        for task in tasks:
+            task.result()
 
     logger.info('All Lithops temporary data cleaned')
 
@@ -1,9 +1,67 @@
 import requests
 import logging
 import os
+import queue
+import threading
+
+from requests.adapters import HTTPAdapter
+
+try:
+    import zstandard
+    zstandard_found = True
+except ModuleNotFoundError:
+    zstandard_found = False
 
 logger = logging.getLogger(__name__)
 
+# Batches smaller than this are sent uncompressed: the zstd frame
+# overhead and the extra CPU are not worth it for tiny payloads
+COMPRESS_MIN_SIZE = 2048
+
+# Shared session so the TCP connection to the gateway is kept
+# alive across metric sends instead of reconnecting on every POST
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+
+# Payloads are POSTed from a single background thread so that network
+# latency never blocks the caller. The queue is bounded: when the
+# gateway cannot keep up, new payloads are dropped rather than queued
+# indefinitely. The thread is started lazily so that each process
+# (e.g. a forked worker) gets its own sender
+_send_queue = queue.Queue(maxsize=64)
+_sender_thread = None
+_sender_lock = threading.Lock()
+
+
+def _send_loop():
+    while True:
+        item = _send_queue.get()
+        try:
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                url, payload, headers = item
+                _session.post(url, data=payload, headers=headers)
+        except Exception as e:
+            logger.error(e)
+        finally:
+            _send_queue.task_done()
+
+
+def _enqueue(url, payload, headers=None):
+    global _sender_thread
+    if _sender_thread is None or not _sender_thread.is_alive():
+        with _sender_lock:
+            if _sender_thread is None or not _sender_thread.is_alive():
+                _sender_thread = threading.Thread(target=_send_loop, daemon=True)
+                _sender_thread.start()
+    try:
+        _send_queue.put_nowait((url, payload, headers))
+    except queue.Full:
+        logger.warning('Prometheus send queue is full, dropping metric')
+
 
 class PrometheusExporter():
 
@@ -15,17 +73,78 @@ class PrometheusExporter():
         self.job = 'lithopserve'
         self.instance = os.environ['__LITHOPS_SESSION_ID'].split('-')[0]
 
+        # Precomputed so the hot send paths only append to it
+        self._base_url = '{}/metrics/job/{}/instance/{}'.format(
+            self.apigateway, self.job, self.instance) if self.apigateway else None
+        self._type_headers = {}
+
+        self.compress = config.get('compress', False) if config else False
+        if self.compress and not zstandard_found:
+            logger.warning("zstandard is not installed, sending "
+                           "prometheus metrics uncompressed")
+            self.compress = False
+        self._cctx = zstandard.ZstdCompressor(level=3) if self.compress else None
+
+    def _type_header(self, name, type):
+        """Return the cached '# TYPE' exposition header for a metric"""
+        header = self._type_headers.get(name)
+        if header is None:
+            header = self._type_headers[name] = ('# TYPE %s %s\n' % (name, type)).encode()
+        return header
+
     def send_metric(self, name, value, type, labels):
         """Send a metric to prometheus"""
 
         if self.enabled and self.apigateway:
-            dim = 'job/{}/instance/{}'.format(self.job, self.instance)
-            for key, val in labels:
-                dim += '/%s/%s' % (key, val)
-            url = '/'.join([self.apigateway, 'metrics', dim])
+            url = self._base_url + ''.join('/%s/%s' % (key, val) for key, val in labels)
             logger.debug('Sending metric "{} {} ({})" to {}'.format(name, value, type, url))
 
+            payload = self._type_header(name, type) + ('%s %s\n' % (name, value)).encode()
+            _enqueue(url, payload)
+
+    def send_batch(self, metrics):
+        """Send multiple metrics to prometheus in a single POST.
+
+        'metrics' is an iterable of (name, value, type, labels) tuples.
+        Labels are encoded into the metric lines instead of the URL path
+        so that all metrics can share a single request.
+        """
+
+        if self.enabled and self.apigateway:
+            lines = []
+            for name, value, type, labels in metrics:
+                lines.append(self._type_header(name, type))
+                label_str = ','.join('%s="%s"' % (key, val) for key, val in labels)
+                if label_str:
+                    lines.append(('%s{%s} %s\n' % (name, label_str, value)).encode())
+                else:
+                    lines.append(('%s %s\n' % (name, value)).encode())
+
+            if not lines:
+                return
+
+            logger.debug('Sending {} metrics to {}'.format(len(lines) // 2, self._base_url))
+
+            payload = b''.join(lines)
+            if self._cctx is not None and len(payload) >= COMPRESS_MIN_SIZE:
+                _enqueue(self._base_url, self._cctx.compress(payload),
+                         headers={'Content-Encoding': 'zstd'})
+            else:
+                _enqueue(self._base_url, payload)
+
+    def flush(self, timeout=5):
+        """Block until all queued metrics have been sent.
+
+        To be called before process exit so that pending payloads
+        are not lost when the daemon sender thread dies.
+        """
+
+        if self.enabled and self.apigateway:
+            if _sender_thread is None or not _sender_thread.is_alive():
+                return
+            sentinel = threading.Event()
             try:
-                requests.post(url, data='# TYPE %s %s\n%s %s\n' % (name, type, name, value))
-            except Exception as e:
-                logger.error(e)
+                _send_queue.put_nowait(sentinel)
+            except queue.Full:
+                return
+            sentinel.wait(timeout)
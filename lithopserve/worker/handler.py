@@ -28,7 +28,6 @@ import traceback
 import multiprocessing as mp
 from queue import Queue, Empty
 from threading import Thread
-from multiprocessing import Process, Pipe
 from tblib import pickling_support
 from types import SimpleNamespace
 from multiprocessing.managers import SyncManager
@@ -48,6 +47,11 @@ pickling_support.install()
 
 logger = logging.getLogger(__name__)
 
+# Pin the jobrunner child process to the fork start method where
+# available: spawn re-imports the whole package in the child, which
+# adds hundreds of ms of startup to every short-lived task
+_mp_ctx = mp.get_context('fork') if hasattr(os, 'fork') else mp.get_context()
+
 
 class ShutdownSentinel:
     """Put an instance of this class on the queue to shut it down"""
@@ -93,7 +97,7 @@ def function_handler(payload):
 
         for pid in range(worker_processes):
             work_queue.put(ShutdownSentinel())
-            p = mp.Process(target=python_queue_consumer, args=(pid, work_queue,))
+            p = _mp_ctx.Process(target=python_queue_consumer, args=(pid, work_queue,))
             job_runners.append(p)
             p.start()
 
@@ -202,11 +206,11 @@ def run_task(task):
         # send init status event
         call_status.send_init_event()
 
-        handler_conn, jobrunner_conn = Pipe()
+        handler_conn, jobrunner_conn = _mp_ctx.Pipe()
         jobrunner = JobRunner(task, jobrunner_conn, internal_storage)
         logger.debug('Starting JobRunner process')
         if task.pid != 0:
-            jrp = Process(target=jobrunner.run) if is_unix_system() else Thread(target=jobrunner.run)
+            jrp = _mp_ctx.Process(target=jobrunner.run) if is_unix_system() else Thread(target=jobrunner.run)
 
         process_id = os.getpid() if is_unix_system() else mp.current_process().pid
         sys_monitor = SystemMonitor(process_id)
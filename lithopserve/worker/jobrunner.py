@@ -306,6 +306,7 @@ class JobRunner:
                     ('function_name', fn_name or 'undefined')
                 )
             )
+            self.prometheus.flush()
 
             if result is not None and not exception:
                 output_upload_start_tstamp = time.time()
@@ -16,6 +16,7 @@
 
 import os
 import sys
+import time
 import pkgutil
 import logging
 import pickle
@@ -198,8 +199,7 @@ def get_runtime_metadata():
     Generates the runtime metadata needed for lithopserve
     """
     runtime_meta = dict()
-    mods = list(pkgutil.iter_modules())
-    runtime_meta["preinstalls"] = [entry for entry in sorted([[mod, is_pkg] for _, mod, is_pkg in mods])]
+    runtime_meta["preinstalls"] = sorted((mod, is_pkg) for _, mod, is_pkg in pkgutil.iter_modules())
     python_version = sys.version_info
     runtime_meta["python_version"] = str(python_version[0]) + "." + str(python_version[1])
     runtime_meta["lithops_version"] = lithops_ver
@@ -221,7 +221,13 @@ def memory_monitor_worker(mm_conn, delay=0.01):
             peak = mem
         return peak
 
-    while not mm_conn.poll(delay):
+    # Poll against a monotonic deadline so the sampling cadence is not
+    # stretched by the time the measurement itself takes. If a
+    # measurement overruns the interval, re-anchor the deadline to now
+    # instead of letting it fall behind and busy-spin with zero waits
+    next_deadline = time.monotonic() + delay
+    while not mm_conn.poll(max(0.0, next_deadline - time.monotonic())):
+        next_deadline = max(next_deadline + delay, time.monotonic())
         try:
             peak = make_measurement(peak)
         except Exception:
@@ -293,7 +299,10 @@ class SystemMonitor:
         if not psutil_found:
             return
 
-        self.process = psutil.Process(self.process_id)
+        if self.process is None:
+            # Constructing a psutil.Process validates the pid against
+            # /proc, so reuse the instance across start/stop cycles
+            self.process = psutil.Process(self.process_id)
 
         # record the initial CPU usage (to be ignored).
         psutil.cpu_percent(interval=None, percpu=True)